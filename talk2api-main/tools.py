@@ -1,5 +1,22 @@
 import os
 import json
+import math
+import operator
+import re
+import time
+import asyncio
+import calendar
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass
+import httpx
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to the stdlib
+    orjson = None
 import google.auth
 import google.auth.transport.requests
 from google.oauth2 import service_account
@@ -7,37 +24,124 @@ from google.adk.tools.apihub_tool.apihub_toolset import APIHubToolset
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.agent_tool import AgentTool
 from google.adk.agents.llm_agent import LlmAgent
+from google.adk.runners import Runner
+from google.adk.sessions import BaseSessionService, InMemorySessionService
 from google.adk.auth.auth_credential import AuthCredential, AuthCredentialTypes
 
 # ==============================================================================
 # API HUB CONFIGURATION - Read lazily to allow .env loading
 # ==============================================================================
 
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")
+
+def _json_loads(data: bytes | str):
+    """Parse JSON, using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
 _SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+_TOKEN_EXPIRY_MARGIN = 60  # seconds before expiry to refresh
+
+_sa_info: dict | None = None  # APIHUB_SA_KEY_JSON, parsed on first credential build
+_cached_creds = None
+_token_exp: float = 0.0
+_token_lock = threading.Lock()
+
+_env: dict | None = None  # Snapshot of config env vars, taken on first use
+
+def _env_float(name: str, default: float) -> float:
+    """Read a numeric env var, falling back to default if unset or malformed."""
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        print(f"[WARN] Invalid {name}={os.getenv(name)!r}, using {default}")
+        return default
+
+def _init_env() -> dict:
+    """Snapshot config env vars once (after .env has been loaded)."""
+    global _env
+    if _env is None:
+        _env = {
+            "search_url": os.getenv("APIHUB_SEARCH_URL", ""),
+            "api_key": os.getenv("APIKEY_CREDENTIAL", ""),
+            "access_token": os.getenv("APIHUB_ACCESS_TOKEN", ""),
+            "search_cache_ttl": _env_float("APIHUB_SEARCH_CACHE_TTL", 3600.0),
+            "embed_model": os.getenv("APIHUB_SEARCH_EMBED_MODEL", "gemini-embedding-001"),
+            "sa_key_json": os.getenv("APIHUB_SA_KEY_JSON", ""),
+            "warmup": os.getenv("APIHUB_WARMUP") == "1",
+        }
+    return _env
+
+def refresh_env() -> None:
+    """Drop the env snapshot, and credentials built from it, so the next lookup
+    re-reads os.environ (e.g. in tests)."""
+    global _env, _sa_info, _cached_creds, _token_exp
+    with _token_lock:
+        _env = None
+        _sa_info = None
+        _cached_creds = None
+        _token_exp = 0.0
 
 def get_apihub_access_token() -> str:
-    """Get a fresh access token for API Hub.
+    """Get an access token for API Hub, refreshed only when close to expiry.
     Uses APIHUB_SA_KEY_JSON (SA key as env var) if set, otherwise falls back to ADC.
     """
+    global _sa_info, _cached_creds, _token_exp
     try:
-        sa_json = os.getenv("APIHUB_SA_KEY_JSON")
-        if sa_json:
-            creds = service_account.Credentials.from_service_account_info(json.loads(sa_json), scopes=_SCOPES)
-        else:
-            creds, _ = google.auth.default(scopes=_SCOPES)
-        creds.refresh(google.auth.transport.requests.Request())
-        return creds.token
+        with _token_lock:
+            if _cached_creds is not None and time.time() < _token_exp - _TOKEN_EXPIRY_MARGIN:
+                return _cached_creds.token
+            if _cached_creds is None:
+                sa_json = _init_env()["sa_key_json"]
+                if sa_json:
+                    if _sa_info is None:
+                        _sa_info = _json_loads(sa_json)
+                    _cached_creds = service_account.Credentials.from_service_account_info(_sa_info, scopes=_SCOPES)
+                else:
+                    _cached_creds, _ = google.auth.default(scopes=_SCOPES)
+            _cached_creds.refresh(google.auth.transport.requests.Request())
+            # google-auth reports expiry as a naive UTC datetime
+            _token_exp = calendar.timegm(_cached_creds.expiry.utctimetuple()) if _cached_creds.expiry else 0.0
+            return _cached_creds.token
     except Exception as e:
         print(f"[WARN] Auth failed ({e}), falling back to APIHUB_ACCESS_TOKEN env var")
-        return os.getenv("APIHUB_ACCESS_TOKEN", "")
+        return _init_env()["access_token"]
+
+async def get_apihub_access_token_async() -> str:
+    """Get an API Hub access token without blocking the event loop."""
+    return await asyncio.to_thread(get_apihub_access_token)
 
 def get_apihub_search_url() -> str:
     """Get API Hub search URL (read lazily after .env is loaded)."""
-    return os.getenv("APIHUB_SEARCH_URL", "")
+    return _init_env()["search_url"]
 
 def get_apikey_credential() -> str:
     """Get API key credential (read lazily after .env is loaded)."""
-    return os.getenv("APIKEY_CREDENTIAL", "")
+    return _init_env()["api_key"]
+
+def get_search_cache_ttl() -> float:
+    """Get semantic search cache TTL in seconds (0 disables the cache)."""
+    return _init_env()["search_cache_ttl"]
+
+def get_embedding_model() -> str:
+    """Get the embedding model used for the semantic search cache."""
+    return _init_env()["embed_model"]
+
+# Tool type -> whether its instances carry an auth_scheme attribute
+_has_auth_scheme: dict[type, bool] = {}
+
+def _tool_has_auth_scheme(tool) -> bool:
+    """Probe a tool type for auth_scheme once, then answer from the cache.
+
+    ADK sets auth_scheme in the tool's __init__, so the first instance of
+    each type is probed rather than the class itself.
+    """
+    tool_type = type(tool)
+    has = _has_auth_scheme.get(tool_type)
+    if has is None:
+        has = _has_auth_scheme[tool_type] = hasattr(tool, 'auth_scheme')
+    return has
 
 def get_auth_credential() -> AuthCredential | None:
     """Create API Key auth credential if configured."""
@@ -54,11 +158,106 @@ def get_auth_credential() -> AuthCredential | None:
 # DYNAMIC AGENT STORAGE - Stores dynamically created execution agent
 # ==============================================================================
 
+_SENTINEL = "TOOL_NOT_FOUND"  # Execution agent reply when it lacks the needed tool
+
 _execution_agent: LlmAgent | None = None
 _execution_agent_tool: AgentTool | None = None
 _current_tools: list[str] = []  # Track what tools current agent has
 
 
+# ==============================================================================
+# EVENT-LOOP LOCAL STATE - Clients, locks and futures bound to one loop
+# ==============================================================================
+
+_loop_state: dict[int, tuple[asyncio.AbstractEventLoop, dict]] = {}  # id(loop) -> (loop, state)
+_loop_state_lock = threading.Lock()
+
+
+def _loop_local() -> dict:
+    """
+    State private to the running event loop.
+    
+    httpx connections, asyncio locks and futures only work on the loop that
+    created them, and hosts may run a fresh loop per query (asyncio.run), so
+    these live here instead of at module level. State of closed loops is dropped.
+    """
+    loop = asyncio.get_running_loop()
+    with _loop_state_lock:
+        for key in [k for k, (l, _) in _loop_state.items() if l.is_closed()]:
+            del _loop_state[key]
+        entry = _loop_state.get(id(loop))
+        if entry is None or entry[0] is not loop:
+            entry = _loop_state[id(loop)] = (loop, {})
+        return entry[1]
+
+
+def _shared_task(kind: str, key: str, make_coro) -> asyncio.Task:
+    """
+    Return the in-flight task for (kind, key) on this loop, starting it if needed.
+    
+    Callers await it through asyncio.shield(), so cancelling one caller never
+    cancels the work the others are waiting on.
+    """
+    inflight = _loop_local().setdefault(kind, {})
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(make_coro())
+        inflight[key] = task
+        
+        def _done(t: asyncio.Task) -> None:
+            if inflight.get(key) is t:
+                del inflight[key]
+            if not t.cancelled():
+                t.exception()  # Mark retrieved in case every caller was cancelled
+        
+        task.add_done_callback(_done)
+    return task
+
+
+# ==============================================================================
+# EXECUTION AGENT POOL - Reuse agents built for previously discovered specs
+# ==============================================================================
+
+_AGENT_POOL_SIZE = 8
+_AGENT_POOL_IDLE_TTL = 1800  # seconds
+_EXECUTION_APP_NAME = "execution_agent"
+_EXECUTION_USER_ID = "user"
+
+
+@dataclass
+class _PooledAgent:
+    spec_key: str  # _fingerprint of the spec resource name
+    agent: LlmAgent
+    agent_tool: AgentTool
+    tool_names: list[str]
+    runner: Runner
+    session_service: BaseSessionService
+    last_used: float
+
+
+_agent_pool: OrderedDict[str, _PooledAgent] = OrderedDict()  # spec fingerprint -> agent
+_agent_pool_lock = threading.Lock()  # Loops on other threads (warmup, asyncio.run hosts) share the pool
+_current_entry: _PooledAgent | None = None  # Pool entry backing _execution_agent
+
+
+def _fingerprint(value: str) -> str:
+    """Short stable hash used as a cache key."""
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _tools_fingerprint(tool_names: list[str]) -> str:
+    """Fingerprint identifying a set of discovered tools."""
+    return _fingerprint(",".join(tool_names))
+
+
+def _evict_idle_agents() -> None:
+    """Drop pooled agents that have not been used within the idle TTL (hold _agent_pool_lock)."""
+    now = time.time()
+    for key in [k for k, entry in _agent_pool.items() if now - entry.last_used > _AGENT_POOL_IDLE_TTL]:
+        print(f"[POOL] Evicting idle agent with tools: {_agent_pool[key].tool_names}")
+        del _agent_pool[key]
+
+
 def reset_execution_agent() -> dict:
     """
     Destroy the current execution agent to allow creating a new one.
@@ -67,12 +266,13 @@ def reset_execution_agent() -> dict:
     Returns:
         Confirmation that the agent was reset
     """
-    global _execution_agent, _execution_agent_tool, _current_tools
+    global _execution_agent, _execution_agent_tool, _current_tools, _current_entry
     
     old_tools = _current_tools.copy()
     _execution_agent = None
     _execution_agent_tool = None
     _current_tools = []
+    _current_entry = None
     
     print(f"[RESET] Destroyed execution agent with tools: {old_tools}")
     return {
@@ -99,10 +299,107 @@ def create_toolset_from_apihub(apihub_resource_name: str, name: str = "discovere
         return None
 
 
+# ==============================================================================
+# SEMANTIC SEARCH CACHE - Reuse API Hub results for similar queries
+# ==============================================================================
+
+_SEARCH_CACHE_THRESHOLD = 0.92
+_SEARCH_CACHE_SIZE = 256
+_EMBED_DIM = 256  # Truncated embedding size; plenty for short capability queries
+
+# Dot product of two unit vectors (cosine similarity); math.sumprod is C-level on 3.12+
+_dot = getattr(math, "sumprod", None) or (lambda a, b: sum(map(operator.mul, a, b)))
+_search_cache: list[tuple[array, str, float]] = []  # (embedding, spec, timestamp)
+_search_exact: dict[str, tuple[str, float]] = {}  # normalized query -> (spec, timestamp)
+_NEG_CACHE_TTL = 300  # seconds
+_NEG_CACHE_SIZE = 256
+_neg_cache: dict[str, float] = {}  # normalized query -> time it returned no results
+
+
+async def _embed_query(query: str) -> array | None:
+    """Embed a query as a small float32 unit vector, or None if embedding is unavailable."""
+    try:
+        from google import genai
+        from google.genai import types
+        state = _loop_local()  # The async genai client holds loop-bound connections
+        if "genai" not in state:
+            state["genai"] = genai.Client()
+        result = await state["genai"].aio.models.embed_content(
+            model=get_embedding_model(),
+            contents=query,
+            config=types.EmbedContentConfig(output_dimensionality=_EMBED_DIM)
+        )
+        values = result.embeddings[0].values
+    except Exception as e:
+        print(f"[WARN] Query embedding failed ({e}), skipping search cache")
+        return None
+    norm = math.sqrt(sum(v * v for v in values))
+    return array('f', (v / norm for v in values)) if norm else None
+
+
+def _search_cache_get_exact(query: str) -> str | None:
+    """Return the cached spec for a previously seen query, without embedding it."""
+    entry = _search_exact.get(query.strip().lower())
+    if entry is None or time.time() - entry[1] >= get_search_cache_ttl():
+        return None
+    return entry[0]
+
+
+def _search_cache_get(embedding: array) -> str | None:
+    """Return the cached spec most similar to embedding, if above threshold."""
+    now = time.time()
+    ttl = get_search_cache_ttl()
+    _search_cache[:] = [entry for entry in _search_cache if now - entry[2] < ttl]
+    best_spec, best_score = None, _SEARCH_CACHE_THRESHOLD
+    for cached, spec, _ in _search_cache:
+        score = _dot(embedding, cached)
+        if score > best_score:
+            best_spec, best_score = spec, score
+    return best_spec
+
+
+def _search_cache_put(query: str, embedding: array | None, spec: str) -> None:
+    """Store a resolved spec under its query text and, if available, its embedding."""
+    now = time.time()
+    _search_exact[query.strip().lower()] = (spec, now)
+    if embedding is not None:
+        _search_cache.append((embedding, spec, now))
+    # Bound the similarity scan and the exact index (oldest entries go first)
+    if len(_search_cache) > _SEARCH_CACHE_SIZE:
+        del _search_cache[0]
+    if len(_search_exact) > _SEARCH_CACHE_SIZE:
+        del _search_exact[next(iter(_search_exact))]
+
+
+def _neg_cache_hit(query: str) -> bool:
+    """True if this query recently returned no results from API Hub."""
+    return time.time() - _neg_cache.get(query.strip().lower(), 0) < _NEG_CACHE_TTL
+
+
+def _neg_cache_put(query: str) -> None:
+    """Remember that a query returned no results, evicting the oldest entry when full."""
+    key = query.strip().lower()
+    _neg_cache.pop(key, None)
+    if len(_neg_cache) >= _NEG_CACHE_SIZE:
+        del _neg_cache[next(iter(_neg_cache))]
+    _neg_cache[key] = time.time()
+
+
 # ==============================================================================
 # SEARCH API HUB - Find APIs by semantic query
 # ==============================================================================
 
+def _http_client() -> httpx.AsyncClient:
+    """Shared client for the running loop; keeps the TLS connection to API Hub alive."""
+    state = _loop_local()
+    if "http" not in state:
+        state["http"] = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=16)
+        )
+    return state["http"]
+
+
 async def search_api_hub(query: str) -> str | None:
     """
     Search API Hub for relevant APIs using semantic search.
@@ -113,15 +410,47 @@ async def search_api_hub(query: str) -> str | None:
     Returns:
         The spec resource name (apihub_resource_name) or None if not found
     """
-    import requests
-    
+    # Coalesce concurrent searches for the same query into one API Hub request
+    key = query.strip().lower()
+    return await asyncio.shield(_shared_task("searches", key, lambda: _search_api_hub(query)))
+
+
+async def _search_api_hub(query: str) -> str | None:
+    """Uncoalesced API Hub search: cache lookup, then the HTTPS POST."""
     search_url = get_apihub_search_url()
-    access_token = get_apihub_access_token()
     
     if not search_url:
         print("[ERROR] APIHUB_SEARCH_URL not configured in .env")
         return None
     
+    # Queries that recently found nothing are not retried until the entry expires
+    if _neg_cache_hit(query):
+        print(f"[CACHE HIT] No results (cached) for: '{query}'")
+        return None
+    
+    # Repeated queries skip both the embedding call and the similarity scan
+    if get_search_cache_ttl() > 0:
+        cached_spec = _search_cache_get_exact(query)
+        if cached_spec:
+            print(f"[CACHE HIT] Search '{query}' -> {cached_spec}")
+            return cached_spec
+    
+    # Fetch the token while the query is embedded; both are awaited here, so a
+    # semantic hit only leaves a memoized token behind, never a stray task
+    if get_search_cache_ttl() > 0:
+        embedding, access_token = await asyncio.gather(
+            _embed_query(query), get_apihub_access_token_async()
+        )
+    else:
+        embedding, access_token = None, await get_apihub_access_token_async()
+    
+    # Serve semantically similar queries from cache (skips the HTTPS round trip)
+    if embedding is not None:
+        cached_spec = _search_cache_get(embedding)
+        if cached_spec:
+            print(f"[CACHE HIT] Search '{query}' -> {cached_spec}")
+            return cached_spec
+    
     if not access_token:
         print("[ERROR] Could not obtain access token (check ADC / GOOGLE_APPLICATION_CREDENTIALS)")
         return None
@@ -141,15 +470,16 @@ async def search_api_hub(query: str) -> str | None:
     }
     
     try:
-        response = requests.post(search_url, headers=headers, json=payload)
+        response = await _http_client().post(search_url, headers=headers, content=_json_dumps(payload))
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         
         # Extract spec from first search result
         search_results = data.get("searchResults", [])
         if not search_results:
             print(f"[SEARCH] No results found for: '{query}'")
+            _neg_cache_put(query)
             return None
         
         # Get the spec resource name from the first result
@@ -158,113 +488,298 @@ async def search_api_hub(query: str) -> str | None:
         
         if spec:
             print(f"[SEARCH] Found spec: {spec}")
+            if get_search_cache_ttl() > 0:
+                _search_cache_put(query, embedding, spec)
             return spec
         else:
             print(f"[SEARCH] No spec in result: {first_result}")
             return None
             
-    except requests.exceptions.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:  # ValueError covers JSON decode errors
         print(f"[ERROR] API Hub search failed: {e}")
         return None
 
 
+# ==============================================================================
+# ACTION CACHE - Reuse results of read-only execution agent requests
+# ==============================================================================
+
+_ACTION_CACHE_SIZE = 256
+# Only requests that start with a read-only verb are cached; any side-effecting
+# verb elsewhere in the request still disqualifies it
+_READ_ONLY_RE = re.compile(r"^(get|list|show|find|search|lookup|look up)\b")
+_MUTATING_RE = re.compile(
+    r"\b(create|update|delete|remove|send|pay|cancel|add|post|put|set|place|submit"
+    r"|approve|register|transfer|book|assign|change|modify|edit)\b"
+)
+_LISTING_RE = re.compile(r"\b(list|all|search|find)\b")
+_action_cache: dict[tuple[str, str], tuple[dict, float, int]] = {}  # key -> (result, timestamp, tokens)
+
+
+def _action_cache_ttl(request: str) -> float:
+    """TTL for a cached request: listings go stale faster than lookups by id."""
+    if _LISTING_RE.search(request):
+        return 60
+    if any(c.isdigit() for c in request):
+        return 600
+    return 300
+
+
+def _action_cache_get(key: tuple[str, str]) -> dict | None:
+    """Return a cached result for key if it has not expired."""
+    entry = _action_cache.get(key)
+    if entry is None:
+        return None
+    result, ts, tokens = entry
+    if time.time() - ts >= _action_cache_ttl(key[1]):
+        del _action_cache[key]
+        return None
+    print(f"[CACHE HIT] Action '{key[1]}' (tokens_saved={tokens})")
+    return dict(result)
+
+
+def _action_cache_put(key: tuple[str, str], result: dict, tokens: int) -> None:
+    """Store a result, evicting the oldest entry when full."""
+    if len(_action_cache) >= _ACTION_CACHE_SIZE:
+        del _action_cache[next(iter(_action_cache))]
+    _action_cache[key] = (result, time.time(), tokens)
+
+
+# ==============================================================================
+# EXECUTION AGENT INSTRUCTION - Rendered once per tool set
+# ==============================================================================
+
+_INSTRUCTION_CACHE_SIZE = 64
+
+# Fixed text around the tool list; only the list varies between execution agents
+_INSTRUCTION_HEAD = '''You are an API Execution Agent with access to real API tools.
+
+You have ONLY these tools available:
+'''
+
+_INSTRUCTION_TAIL = f'''
+
+IMPORTANT: If you cannot fulfill the request with your available tools, 
+respond with EXACTLY: "{_SENTINEL}: <description of what tool is needed>"
+
+When you CAN fulfill the request:
+1. Identify which tool to use
+2. Call the tool with the correct parameters
+3. Return the result
+
+Be precise with parameter names - use exactly what the tool expects.
+'''
+
+_instruction_cache: dict[str, str] = {}  # tools fingerprint -> instruction
+
+
+def _render_instruction(tool_names: list[str], bullets: list[str]) -> str:
+    """Build the execution agent instruction, memoized by tool set."""
+    key = _tools_fingerprint(tool_names)
+    instruction = _instruction_cache.get(key)
+    if instruction is None:
+        instruction = _INSTRUCTION_HEAD + "\n".join(bullets) + _INSTRUCTION_TAIL
+        if len(_instruction_cache) >= _INSTRUCTION_CACHE_SIZE:
+            del _instruction_cache[next(iter(_instruction_cache))]
+        _instruction_cache[key] = instruction
+    return instruction
+
+
 # ==============================================================================
 # DISCOVER AND CREATE EXECUTION AGENT
 # ==============================================================================
 
-async def discover_and_create_agent(query: str) -> dict:
+async def _acquire_agent(query: str) -> tuple[_PooledAgent | None, dict]:
     """
-    Search API Hub, create toolset, and create a NEW execution agent with those tools.
-    
-    This REPLACES any existing execution agent with a new one.
-    Call this whenever you need different tools.
+    Find or build the pooled execution agent for a query.
     
-    Args:
-        query: Semantic search query describing the API capability needed
+    Does not touch the current execution agent, so it is safe to run for
+    several queries at once (see warmup).
     
     Returns:
-        dict with agent status and available tools
+        The pool entry (None on failure) and the status dict for the caller
     """
-    global _execution_agent, _execution_agent_tool, _current_tools
-    
-    # Step 0: Destroy any existing execution agent
-    if _execution_agent is not None:
-        print(f"[RESET] Replacing existing agent (had tools: {_current_tools})")
-        _execution_agent = None
-        _execution_agent_tool = None
-        _current_tools = []
-    
     # Step 1: Search API Hub
     apihub_resource_name = await search_api_hub(query)
     
     if not apihub_resource_name:
-        return {
+        return None, {
             "success": False,
             "message": f"No API found matching: {query}"
         }
     
-    # Step 2: Create toolset with REAL API tools
-    toolset = create_toolset_from_apihub(
+    # Step 2: Reuse a pooled agent if this spec was already discovered
+    pool_key = _fingerprint(apihub_resource_name)
+    with _agent_pool_lock:
+        _evict_idle_agents()
+        entry = _agent_pool.get(pool_key)
+        if entry is not None:
+            _agent_pool.move_to_end(pool_key)
+            entry.last_used = time.time()
+    
+    if entry is not None:
+        print(f"[POOL HIT] Reusing execution agent with tools: {entry.tool_names}")
+        return entry, {
+            "success": True,
+            "message": f"Reused execution agent with {len(entry.tool_names)} tools",
+            "tools": entry.tool_names,
+            "instruction": "Now use 'call_execution_agent' to execute API calls"
+        }
+    
+    # Concurrent misses on the same spec share one build
+    entry, result = await asyncio.shield(
+        _shared_task("builds", pool_key, lambda: _build_agent(query, apihub_resource_name, pool_key))
+    )
+    return entry, dict(result)
+
+
+async def _build_agent(query: str, apihub_resource_name: str, pool_key: str) -> tuple[_PooledAgent | None, dict]:
+    """Build an execution agent for a spec and add it to the pool."""
+    # Step 3: Create toolset with REAL API tools
+    toolset = await asyncio.to_thread(
+        create_toolset_from_apihub,
         apihub_resource_name=apihub_resource_name,
         name="discovered-api",
         description=f"API discovered for: {query}"
     )
     
     if toolset is None:
-        return {
+        return None, {
             "success": False,
             "message": f"Failed to parse API spec for: {query}. The spec may be malformed.",
             "spec": apihub_resource_name
         }
     
-    # Step 3: Get tools and configure auth
+    # Step 4: Get tools and configure auth
     tools = await toolset.get_tools()
-    tool_names = [tool.name for tool in tools]
-    _current_tools = tool_names  # Track current tools
     
-    # Configure API Key auth on tools that need it
+    # Collect names and instruction bullets, and configure API Key auth, in one pass
     auth_cred = get_auth_credential()
-    if auth_cred:
-        for tool in tools:
-            if hasattr(tool, 'auth_scheme') and tool.auth_scheme:
-                tool.configure_auth_credential(auth_cred)
+    tool_names = []
+    bullets = []
+    for tool in tools:
+        tool_names.append(tool.name)
+        bullets.append(f"- {tool.name}")
+        if auth_cred and _tool_has_auth_scheme(tool) and tool.auth_scheme:
+            tool.configure_auth_credential(auth_cred)
     
     print(f"[OK] Discovered {len(tool_names)} tools: {tool_names}")
     
-    # Step 4: Create a NEW execution agent with the REAL tools
-    _execution_agent = LlmAgent(
+    # Step 5: Create a NEW execution agent with the REAL tools
+    agent = LlmAgent(
         model='gemini-2.0-flash',
         name='api_execution_agent',
         description=f'Executes API calls for: {query}',
-        instruction=f'''You are an API Execution Agent with access to real API tools.
-
-You have ONLY these tools available:
-{chr(10).join(f"- {name}" for name in tool_names)}
-
-IMPORTANT: If you cannot fulfill the request with your available tools, 
-respond with EXACTLY: "TOOL_NOT_FOUND: <description of what tool is needed>"
-
-When you CAN fulfill the request:
-1. Identify which tool to use
-2. Call the tool with the correct parameters
-3. Return the result
-
-Be precise with parameter names - use exactly what the tool expects.
-''',
+        instruction=_render_instruction(tool_names, bullets),
         tools=[toolset],  # <-- REAL tools, not proxy!
     )
     
-    # Step 5: Wrap the agent as a tool so it can be called
-    _execution_agent_tool = AgentTool(agent=_execution_agent)
-    
-    return {
+    # Step 6: Wrap the agent as a tool, give it a long-lived runner, and pool it
+    session_service = InMemorySessionService()
+    entry = _PooledAgent(
+        spec_key=pool_key,
+        agent=agent,
+        agent_tool=AgentTool(agent=agent),
+        tool_names=tool_names,
+        runner=Runner(
+            agent=agent,
+            app_name=_EXECUTION_APP_NAME,
+            session_service=session_service
+        ),
+        session_service=session_service,
+        last_used=time.time()
+    )
+    with _agent_pool_lock:
+        # Another thread's loop may have built the same spec meanwhile; keep one
+        entry = _agent_pool.setdefault(pool_key, entry)
+        _agent_pool.move_to_end(pool_key)
+        while len(_agent_pool) > _AGENT_POOL_SIZE:
+            _, evicted = _agent_pool.popitem(last=False)
+            print(f"[POOL] Evicting agent with tools: {evicted.tool_names}")
+    
+    return entry, {
         "success": True,
-        "message": f"Created execution agent with {len(tool_names)} tools",
-        "tools": tool_names,
+        "message": f"Created execution agent with {len(entry.tool_names)} tools",
+        "tools": entry.tool_names,
         "instruction": "Now use 'call_execution_agent' to execute API calls"
     }
 
 
+async def discover_and_create_agent(query: str) -> dict:
+    """
+    Search API Hub, create toolset, and create a NEW execution agent with those tools.
+    
+    This REPLACES any existing execution agent with a new one.
+    Call this whenever you need different tools.
+    
+    Args:
+        query: Semantic search query describing the API capability needed
+    
+    Returns:
+        dict with agent status and available tools
+    """
+    global _execution_agent, _execution_agent_tool, _current_tools, _current_entry
+    
+    # Destroy any existing execution agent
+    if _execution_agent is not None:
+        print(f"[RESET] Replacing existing agent (had tools: {_current_tools})")
+        _execution_agent = None
+        _execution_agent_tool = None
+        _current_tools = []
+        _current_entry = None
+    
+    entry, result = await _acquire_agent(query)
+    
+    if entry is not None:
+        _execution_agent = entry.agent
+        _execution_agent_tool = entry.agent_tool
+        _current_tools = entry.tool_names  # Track current tools
+        _current_entry = entry
+    
+    return result
+
+
+# ==============================================================================
+# WARMUP - Pre-build agents for common API categories
+# ==============================================================================
+
+_WARMUP_QUERIES = ["customer", "orders", "inventory", "payments", "suppliers", "products"]
+
+
+async def warmup(queries: list[str] = _WARMUP_QUERIES) -> None:
+    """Discover and pool execution agents for queries without changing the current agent."""
+    results = await asyncio.gather(*[_acquire_agent(q) for q in queries], return_exceptions=True)
+    ready = sum(1 for r in results if not isinstance(r, BaseException) and r[0] is not None)
+    print(f"[WARMUP] Pooled {ready}/{len(queries)} execution agents")
+
+
+async def _warmup_on_own_loop() -> None:
+    """Warm up, then close the HTTP client tied to this short-lived loop."""
+    try:
+        await warmup()
+    finally:
+        client = _loop_local().get("http")
+        if client is not None:
+            await client.aclose()
+
+
+def _run_warmup() -> None:
+    """
+    Start warmup in the background when APIHUB_WARMUP=1.
+    
+    Runs on its own loop in a daemon thread, so it works whether or not the
+    importer already has a running loop and never holds up startup. Requests
+    that arrive first build their own agents; the pool is shared under
+    _agent_pool_lock.
+    """
+    if not _init_env()["warmup"]:
+        refresh_env()  # Don't pin the import-time snapshot; keep config lazy
+        return
+    threading.Thread(
+        target=asyncio.run, args=(_warmup_on_own_loop(),), name="apihub-warmup", daemon=True
+    ).start()
+
+
 async def call_execution_agent(request: str) -> dict:
     """
     Call the dynamically created execution agent.
@@ -279,30 +794,32 @@ async def call_execution_agent(request: str) -> dict:
     """
     global _execution_agent
     
-    if _execution_agent is None:
+    if _execution_agent is None or _current_entry is None:
         return {
             "error": "No execution agent created. Call discover_and_create_agent first."
         }
     
+    # Serve repeated read-only requests without re-running the LLM. Keyed on the
+    # spec, since two specs can expose operations with the same names
+    normalized = request.strip().lower()
+    cache_key = (_current_entry.spec_key, normalized)
+    cacheable = bool(_READ_ONLY_RE.match(normalized)) and not _MUTATING_RE.search(normalized)
+    if cacheable:
+        cached = _action_cache_get(cache_key)
+        if cached is not None:
+            return cached
+    
     print(f"[CALL] Calling execution agent with: {request}")
     
     try:
-        from google.adk.runners import Runner
-        from google.adk.sessions import InMemorySessionService
         from google.genai.types import Content, Part
         
-        # Create a runner for the execution agent
-        session_service = InMemorySessionService()
-        runner = Runner(
-            agent=_execution_agent,
-            app_name="execution_agent",
-            session_service=session_service
-        )
-        
-        # Create a session
-        session = await session_service.create_session(
-            app_name="execution_agent",
-            user_id="user"
+        # Reuse the runner built alongside the execution agent, but give each
+        # call its own session so history never leaks between calls or users
+        entry = _current_entry
+        session = await entry.session_service.create_session(
+            app_name=_EXECUTION_APP_NAME,
+            user_id=_EXECUTION_USER_ID
         )
         
         # Create the user message
@@ -311,23 +828,54 @@ async def call_execution_agent(request: str) -> dict:
             parts=[Part(text=request)]
         )
         
-        # Run the agent - collect the last text response from model
+        # Run the agent - collect the last text response from model.
+        # Stop as soon as the sentinel shows up; aclosing() aborts the rest of the run.
+        # buf holds only the response being streamed: partial events append to it,
+        # and the final (non-partial) event carries that response's full text.
         final_response = None
-        async for event in runner.run_async(
-            session_id=session.id,
-            user_id="user",
-            new_message=user_content
-        ):
-            # We only care about events with text content from the model
-            if hasattr(event, 'content') and event.content and hasattr(event.content, 'parts'):
-                for part in event.content.parts:
-                    if hasattr(part, 'text') and part.text:
-                        final_response = part.text
+        tokens_used = 0
+        buf = ""
+        response_done = True
+        tool_not_found = False
+        try:
+            events = entry.runner.run_async(
+                session_id=session.id,
+                user_id=_EXECUTION_USER_ID,
+                new_message=user_content
+            )
+            async with aclosing(events):
+                async for event in events:
+                    usage = getattr(event, 'usage_metadata', None)
+                    if usage and usage.total_token_count:
+                        tokens_used += usage.total_token_count
+                    # We only care about events with text content from the model
+                    if not (hasattr(event, 'content') and event.content and hasattr(event.content, 'parts')):
+                        continue
+                    text = "".join(part.text for part in event.content.parts if getattr(part, 'text', None))
+                    if not text:
+                        continue
+                    partial = bool(getattr(event, 'partial', False))
+                    if partial and not response_done:
+                        buf += text
+                    else:
+                        buf = text  # A complete response, or the first chunk of a new one
+                    response_done = not partial
+                    final_response = buf
+                    if _SENTINEL in buf:
+                        final_response = buf[buf.index(_SENTINEL):]
+                        tool_not_found = True
+                        break
+        finally:
+            await entry.session_service.delete_session(
+                app_name=_EXECUTION_APP_NAME,
+                user_id=_EXECUTION_USER_ID,
+                session_id=session.id
+            )
         
         print(f"[RESULT] {final_response}")
         
         # Check if execution agent signaled it doesn't have the right tool
-        if final_response and "TOOL_NOT_FOUND" in final_response:
+        if tool_not_found:
             return {
                 "success": False,
                 "tool_not_found": True,
@@ -336,7 +884,11 @@ async def call_execution_agent(request: str) -> dict:
                 "instruction": "Call discover_and_create_agent with a DIFFERENT query."
             }
         
-        return {"success": True, "result": final_response}
+        result = {"success": True, "result": final_response}
+        # An empty or missing answer is not worth replaying for minutes
+        if cacheable and isinstance(final_response, str) and final_response.strip():
+            _action_cache_put(cache_key, dict(result), tokens_used)
+        return result
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -352,3 +904,5 @@ discover_and_create_agent_tool = FunctionTool(func=discover_and_create_agent)
 call_execution_agent_tool = FunctionTool(func=call_execution_agent)
 reset_execution_agent_tool = FunctionTool(func=reset_execution_agent)
 
+_run_warmup()
+